@@ -0,0 +1,69 @@
+from typing import Any, NamedTuple, Optional
+
+
+class Call(NamedTuple):
+    args: tuple
+    kwargs: dict
+
+
+# Lightweight replacement of MagicMock for stubbing repository methods.
+# Records calls and supports the subset of the MagicMock API used by the tests.
+class Spy:
+    return_value: Any
+    call_args_list: list[Call]
+
+    def __init__(self, return_value: Any = None, side_effect: Any = None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.call_args_list = []
+
+    # Like MagicMock, assigning a new side effect restarts iteration
+    @property
+    def side_effect(self) -> Any:
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, side_effect: Any):
+        self._side_effect = side_effect
+        self._side_effect_iterator = None
+
+    def __call__(self, *args, **kwargs):
+        self.call_args_list.append(Call(args, kwargs))
+
+        if self.side_effect is None:
+            return self.return_value
+
+        if isinstance(self.side_effect, BaseException) or (
+                isinstance(self.side_effect, type) and issubclass(self.side_effect, BaseException)):
+            raise self.side_effect
+
+        if callable(self.side_effect):
+            return self.side_effect(*args, **kwargs)
+
+        if self._side_effect_iterator is None:
+            self._side_effect_iterator = iter(self.side_effect)
+
+        return next(self._side_effect_iterator)
+
+    @property
+    def call_count(self) -> int:
+        return len(self.call_args_list)
+
+    @property
+    def call_args(self) -> Optional[Call]:
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    def assert_called(self):
+        if not self.call_args_list:
+            raise AssertionError("Expected spy to have been called")
+
+    def assert_called_once_with(self, *args, **kwargs):
+        if self.call_count != 1:
+            raise AssertionError("Expected spy to have been called once, called " + str(self.call_count) + " times")
+
+        if self.call_args != Call(args, kwargs):
+            raise AssertionError("Expected call " + str(Call(args, kwargs)) + ", actual " + str(self.call_args))
+
+    def assert_not_called(self):
+        if self.call_args_list:
+            raise AssertionError("Expected spy not to have been called, called " + str(self.call_count) + " times")
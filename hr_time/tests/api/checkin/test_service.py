@@ -1,12 +1,12 @@
 import datetime
 import unittest
-from unittest.mock import MagicMock
 
 from hr_time.api.check_in.event import CheckinEvent
 from hr_time.api.check_in.list import CheckinList
 from hr_time.api.check_in.repository import CheckinRepository
 from hr_time.api.check_in.service import CheckinService, State, Action
 from hr_time.api.employee.repository import EmployeeRepository, Employee, TimeModel
+from hr_time.tests._spy import Spy
 from hr_time.tests.fixtures import Fixtures
 
 
@@ -16,84 +16,94 @@ class CheckinServiceTest(unittest.TestCase):
 
     service: CheckinService
 
+    # Time reference of the current test, read once
+    now: datetime.datetime
+
     def setUp(self):
         super().setUp()
 
+        self.now = datetime.datetime.now()
+
         self.employee = EmployeeRepository()
         self.data = CheckinRepository()
 
         self.service = CheckinService(self.employee, self.data)
 
     def test_get_current_status_employee_unknown(self):
-        self.employee.get_current = MagicMock(return_value=None)
+        self.employee.get_current = Spy(return_value=None)
 
         self.assertEqual(State.Unknown, self.service.get_current_status().state)
-        self.employee.get_current.assert_called_once()
+        self.assertEqual(1, self.employee.get_current.call_count)
 
     def test_get_current_empty_event_list(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.get = MagicMock(return_value=CheckinList([]))
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.get = Spy(return_value=CheckinList([]))
 
-        self.assertEqual(State.Out, self.service.get_current_status().state)
+        # The service reads the current date itself, which may change at midnight
+        before = datetime.date.today()
+        status = self.service.get_current_status()
+        after = datetime.date.today()
+
+        self.assertEqual(State.Out, status.state)
 
-        self.employee.get_current.assert_called_once()
-        self.data.get.assert_called_once()
-        self.assertEqual(datetime.date.today(), self.data.get.call_args.args[0])
+        self.assertEqual(1, self.employee.get_current.call_count)
+        self.assertEqual(1, self.data.get.call_count)
+        self.assertIn(self.data.get.call_args.args[0], {before, after})
         self.assertEqual("EMP-009", self.data.get.call_args.args[1])
 
     def test_get_current_break(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.get = MagicMock(return_value=CheckinList([
-            CheckinEvent("E001", datetime.datetime.now(), True, False),
-            CheckinEvent("E002", datetime.datetime.now(), False, True),
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.get = Spy(return_value=CheckinList([
+            CheckinEvent("E001", self.now, True, False),
+            CheckinEvent("E002", self.now, False, True),
         ]))
 
         self.assertEqual(State.Break, self.service.get_current_status().state)
 
     def test_get_current_work(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.get = MagicMock(return_value=CheckinList([
-            CheckinEvent("E001", datetime.datetime.now(), True, False),
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.get = Spy(return_value=CheckinList([
+            CheckinEvent("E001", self.now, True, False),
         ]))
 
         self.assertEqual(State.In, self.service.get_current_status().state)
 
     def test_get_current_out(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.get = MagicMock(return_value=CheckinList([
-            CheckinEvent("E001", datetime.datetime.now(), True, False),
-            CheckinEvent("E002", datetime.datetime.now(), False, False),
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.get = Spy(return_value=CheckinList([
+            CheckinEvent("E001", self.now, True, False),
+            CheckinEvent("E002", self.now, False, False),
         ]))
 
         self.assertEqual(State.Out, self.service.get_current_status().state)
 
     def test_get_current_had_break_false(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.get = MagicMock(return_value=CheckinList([
-            CheckinEvent("E001", datetime.datetime.now(), True, False),
-            CheckinEvent("E002", datetime.datetime.now(), False, False),
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.get = Spy(return_value=CheckinList([
+            CheckinEvent("E001", self.now, True, False),
+            CheckinEvent("E002", self.now, False, False),
         ]))
 
         self.assertFalse(self.service.get_current_status().had_break)
 
     def test_get_current_had_break_true(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.get = MagicMock(return_value=CheckinList([
-            CheckinEvent("E001", datetime.datetime.now(), True, False),
-            CheckinEvent("E002", datetime.datetime.now(), False, True),
-            CheckinEvent("E003", datetime.datetime.now(), True, False),
-            CheckinEvent("E004", datetime.datetime.now(), False, False),
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.get = Spy(return_value=CheckinList([
+            CheckinEvent("E001", self.now, True, False),
+            CheckinEvent("E002", self.now, False, True),
+            CheckinEvent("E003", self.now, True, False),
+            CheckinEvent("E004", self.now, False, False),
         ]))
 
         self.assertTrue(self.service.get_current_status().had_break)
 
     def test_checkin_employee_not_found(self):
-        self.employee.get_current = MagicMock(return_value=None)
+        self.employee.get_current = Spy(return_value=None)
         self.assertRaises(RuntimeError, self.service.checkin, Action.startOfWork)
 
     def test_checkin_start_of_work(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.checkin = MagicMock()
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.checkin = Spy()
 
         self.service.checkin(Action.startOfWork)
 
@@ -102,8 +112,8 @@ class CheckinServiceTest(unittest.TestCase):
         self.assertFalse(self.data.checkin.call_args.args[2])
 
     def test_checkin_break(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.checkin = MagicMock()
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.checkin = Spy()
 
         self.service.checkin(Action.breakTime)
 
@@ -112,8 +122,8 @@ class CheckinServiceTest(unittest.TestCase):
         self.assertTrue(self.data.checkin.call_args.args[2])
 
     def test_checkin_endOfWork(self):
-        self.employee.get_current = MagicMock(return_value=Fixtures.employee)
-        self.data.checkin = MagicMock()
+        self.employee.get_current = Spy(return_value=Fixtures.employee)
+        self.data.checkin = Spy()
 
         self.service.checkin(Action.endOfWork)
 
@@ -1,6 +1,5 @@
 import datetime
 import unittest
-from unittest.mock import MagicMock
 
 from hr_time.api.attendance.repository import AttendanceRepository, Attendance, LeaveType, Status
 from hr_time.api.check_in.event import CheckinEvent
@@ -14,11 +13,18 @@ from hr_time.api.flextime.repository import FlextimeStatusRepository
 from hr_time.api.holiday.repository import HolidayRepository
 from hr_time.api.utils.clock import Clock
 from hr_time.api.vacation.repository import VacationRepository, Request
+from hr_time.tests._spy import Spy
 
 
 class FlextimeProcessingTest(unittest.TestCase):
     flextime_definition: FlextimeDefinition
 
+    EMPTY_CHECKINS: CheckinList
+    EMPTY_BREAKS: BreakTimeDefinitions
+
+    # Cache of flextime test employees by join date
+    _employees: dict[datetime.date, Employee]
+
     clock: Clock
     daily_status: FlextimeStatusRepository
     employee: EmployeeRepository
@@ -31,16 +37,37 @@ class FlextimeProcessingTest(unittest.TestCase):
 
     service: FlexTimeProcessingService
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        # Read-only for the service under test, hence shared by all tests
+        cls.flextime_definition = FlextimeDefinition(3600)
+        cls.flextime_definition.insert(WorkdayDefinition(0, 28_800, datetime.timedelta(), datetime.timedelta()))
+        cls.flextime_definition.insert(WorkdayDefinition(1, 28_800, datetime.timedelta(), datetime.timedelta()))
+        cls.flextime_definition.insert(WorkdayDefinition(2, 28_800, datetime.timedelta(), datetime.timedelta()))
+        cls.flextime_definition.insert(WorkdayDefinition(3, 28_800, datetime.timedelta(), datetime.timedelta()))
+        cls.flextime_definition.insert(WorkdayDefinition(4, 21_600, datetime.timedelta(), datetime.timedelta()))
+        cls.flextime_definition.insert(WorkdayDefinition(5, 0, datetime.timedelta(), datetime.timedelta()))
+        cls.flextime_definition.insert(WorkdayDefinition(6, 0, datetime.timedelta(), datetime.timedelta()))
+
+        # Empty stub results, not modified by the service under test
+        cls.EMPTY_CHECKINS = CheckinList([])
+        cls.EMPTY_BREAKS = BreakTimeDefinitions()
+
+        cls._employees = {}
+
+    # Returns the shared flextime test employee who joined at the given date
+    @classmethod
+    def _employee(cls, join: datetime.date = datetime.date(2023, 10, 1)) -> Employee:
+        if join not in cls._employees:
+            cls._employees[join] = Employee("001", "Test employee", TimeModel.Flextime, "Executive",
+                                            datetime.date(1990, 5, 21), join)
+
+        return cls._employees[join]
+
     def setUp(self):
         super().setUp()
-        self.flextime_definition = FlextimeDefinition(3600)
-        self.flextime_definition.insert(WorkdayDefinition(0, 28_800, datetime.timedelta(), datetime.timedelta()))
-        self.flextime_definition.insert(WorkdayDefinition(1, 28_800, datetime.timedelta(), datetime.timedelta()))
-        self.flextime_definition.insert(WorkdayDefinition(2, 28_800, datetime.timedelta(), datetime.timedelta()))
-        self.flextime_definition.insert(WorkdayDefinition(3, 28_800, datetime.timedelta(), datetime.timedelta()))
-        self.flextime_definition.insert(WorkdayDefinition(4, 21_600, datetime.timedelta(), datetime.timedelta()))
-        self.flextime_definition.insert(WorkdayDefinition(5, 0, datetime.timedelta(), datetime.timedelta()))
-        self.flextime_definition.insert(WorkdayDefinition(6, 0, datetime.timedelta(), datetime.timedelta()))
 
         self.clock = Clock()
         self.daily_status = FlextimeStatusRepository()
@@ -57,358 +84,225 @@ class FlextimeProcessingTest(unittest.TestCase):
                                                  self.checkin)
 
     def test_process_daily_status_no_flextime_time_model(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-        self.employee.get_all = MagicMock(return_value=[
+        self.employee.get_all = Spy(return_value=[
             Employee("001", "Test employee", TimeModel.Undefined, "Executive", datetime.date(1990, 5, 21),
                      datetime.date.today())
         ])
 
-        self.daily_status.add = MagicMock()
+        self.daily_status.add = Spy()
 
         self.service.process_daily_status()
 
-        self.employee.get_all.assert_called_once()
+        self.assertEqual(1, self.employee.get_all.call_count)
         self.daily_status.add.assert_not_called()
 
     def test_process_daily_status_no_flextime_def_found(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-        self.employee.get_all = MagicMock(return_value=[
-            Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                     datetime.date.today())
+        self.employee.get_all = Spy(return_value=[
+            self._employee(datetime.date.today())
         ])
 
-        self.definitions.get_by_grade = MagicMock(return_value=None)
-        self.daily_status.add = MagicMock()
+        self.definitions.get_by_grade = Spy(return_value=None)
+        self.daily_status.add = Spy()
 
         self.service.process_daily_status()
 
-        self.definitions.get_by_grade.assert_called_once()
+        self.assertEqual(1, self.definitions.get_by_grade.call_count)
         self.daily_status.add.assert_not_called()
 
     def test_process_daily_status_already_up2date(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date.today())
-        self.employee.get_all = MagicMock(return_value=[employee])
+        employee = self._employee(datetime.date.today())
+        self.employee.get_all = Spy(return_value=[employee])
 
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
+        self.definitions.get_by_grade = Spy(return_value=self.flextime_definition)
 
         today = datetime.date(2023, 10, 16)
-        self.clock.date_today = MagicMock(return_value=today)
+        self.clock.date_today = Spy(return_value=today)
 
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 10, 15))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=0)
-        self.daily_status.add = MagicMock()
-        self.attendance.create = MagicMock()
+        self.daily_status.get_latest_status_date = Spy(return_value=datetime.date(2023, 10, 15))
+        self.daily_status.get_flextime_balance = Spy(return_value=0)
+        self.daily_status.add = Spy()
+        self.attendance.create = Spy()
 
         self.service.process_daily_status()
 
-        self.daily_status.get_latest_status_date.assert_called_once()
         self.daily_status.get_latest_status_date.assert_called_once_with(employee)
 
         self.daily_status.add.assert_not_called()
         self.attendance.create.assert_not_called()
 
     def test_process_daily_status_holiday(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date.today())
-        self.employee.get_all = MagicMock(return_value=[employee])
+        employee = self._employee(datetime.date.today())
+        self.employee.get_all = Spy(return_value=[employee])
 
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
+        self.definitions.get_by_grade = Spy(return_value=self.flextime_definition)
 
         today = datetime.date(2023, 10, 17)
-        self.clock.date_today = MagicMock(return_value=today)
+        self.clock.date_today = Spy(return_value=today)
 
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 10, 15))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=1.5)
-        self.daily_status.add = MagicMock()
+        self.daily_status.get_latest_status_date = Spy(return_value=datetime.date(2023, 10, 15))
+        self.daily_status.get_flextime_balance = Spy(return_value=1.5)
+        self.daily_status.add = Spy()
 
-        self.attendance.get = MagicMock(return_value=None)
-        self.holidays.is_holiday = MagicMock(return_value=True)
+        self.attendance.get = Spy(return_value=None)
+        self.holidays.is_holiday = Spy(return_value=True)
 
-        self.checkin.get = MagicMock(return_value=CheckinList([]))
+        self.checkin.get = Spy(return_value=self.EMPTY_CHECKINS)
+        self.attendance.create = Spy()
 
         self.service.process_daily_status()
 
         self.holidays.is_holiday.assert_called_once_with(datetime.date(2023, 10, 16))
-        self.attendance.create = MagicMock()
 
-        self.daily_status.add.assert_called_once()
-        self.assertEqual("001", self.daily_status.add.call_args.args[0].employee_id)
-        self.assertEqual(datetime.date(2023, 10, 16), self.daily_status.add.call_args.args[0].date)
-        self.assertEqual(0, self.daily_status.add.call_args.args[0].total_working_hours)
-        self.assertEqual(1.5, self.daily_status.add.call_args.args[0].time_balance)
-        self.assertEqual(0, self.daily_status.add.call_args.args[0].target_working_time)
+        self.assertEqual(1, self.daily_status.add.call_count)
+        status = self.daily_status.add.call_args.args[0]
+        self.assertEqual("001", status.employee_id)
+        self.assertEqual(datetime.date(2023, 10, 16), status.date)
+        self.assertEqual(0, status.total_working_hours)
+        self.assertEqual(1.5, status.time_balance)
+        self.assertEqual(0, status.target_working_time)
 
         self.attendance.create.assert_not_called()
 
     def test_process_join_date_used(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date(2023, 10, 1))
-        self.employee.get_all = MagicMock(return_value=[employee])
+        employee = self._employee()
+        self.employee.get_all = Spy(return_value=[employee])
 
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
+        self.definitions.get_by_grade = Spy(return_value=self.flextime_definition)
 
         today = datetime.date(2023, 10, 5)
-        self.clock.date_today = MagicMock(return_value=today)
+        self.clock.date_today = Spy(return_value=today)
 
-        self.daily_status.get_latest_status_date = MagicMock(return_value=None)
-        self.daily_status.get_flextime_balance = MagicMock(return_value=0)
-        self.daily_status.add = MagicMock()
+        self.daily_status.get_latest_status_date = Spy(return_value=None)
+        self.daily_status.get_flextime_balance = Spy(return_value=0)
+        self.daily_status.add = Spy()
 
-        self.holidays.is_holiday = MagicMock(return_value=False)
-        self.attendance.get = MagicMock(return_value=None)
+        self.holidays.is_holiday = Spy(return_value=False)
+        self.attendance.get = Spy(return_value=None)
 
-        self.checkin.get = MagicMock(return_value=CheckinList([]))
-        self.attendance.create = MagicMock()
+        self.checkin.get = Spy(return_value=self.EMPTY_CHECKINS)
+        self.attendance.create = Spy()
 
         self.service.process_daily_status()
 
-        self.holidays.is_holiday.assert_called()
-        self.assertEqual(datetime.date(2023, 10, 1), self.holidays.is_holiday.call_args_list[0].args[0])
-        self.assertEqual(datetime.date(2023, 10, 2), self.holidays.is_holiday.call_args_list[1].args[0])
-        self.assertEqual(datetime.date(2023, 10, 3), self.holidays.is_holiday.call_args_list[2].args[0])
-        self.assertEqual(datetime.date(2023, 10, 4), self.holidays.is_holiday.call_args_list[3].args[0])
+        processed_days = [datetime.date(2023, 10, day) for day in range(1, 5)]
 
-        self.daily_status.add.assert_called()
-        self.assertEqual(datetime.date(2023, 10, 1), self.daily_status.add.call_args_list[0].args[0].date)
-        self.assertEqual(datetime.date(2023, 10, 2), self.daily_status.add.call_args_list[1].args[0].date)
-        self.assertEqual(datetime.date(2023, 10, 3), self.daily_status.add.call_args_list[2].args[0].date)
-        self.assertEqual(datetime.date(2023, 10, 4), self.daily_status.add.call_args_list[3].args[0].date)
+        self.assertEqual(processed_days, [c.args[0] for c in self.holidays.is_holiday.call_args_list])
+        self.assertEqual(processed_days, [c.args[0].date for c in self.daily_status.add.call_args_list])
 
-        self.attendance.create.assert_called()
-        self.assertEqual(datetime.date(2023, 10, 2), self.attendance.create.call_args_list[0].args[0].date)
-        self.assertEqual(datetime.date(2023, 10, 3), self.attendance.create.call_args_list[1].args[0].date)
-        self.assertEqual(datetime.date(2023, 10, 4), self.attendance.create.call_args_list[2].args[0].date)
+        # No attendance for the first day, which is a sunday
+        self.assertEqual(processed_days[1:], [c.args[0].date for c in self.attendance.create.call_args_list])
 
     def test_process_correct_target_working_time_and_balance(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date(2023, 10, 1))
-        self.employee.get_all = MagicMock(return_value=[employee])
+        employee = self._employee()
+        self.employee.get_all = Spy(return_value=[employee])
 
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
+        self.definitions.get_by_grade = Spy(return_value=self.flextime_definition)
 
-        today = datetime.date(2023, 10, 16)
-        self.clock.date_today = MagicMock(return_value=today)
-
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 10, 8))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=2.1)
-        self.daily_status.add = MagicMock()
-
-        self.holidays.is_holiday = MagicMock(return_value=False)
-        self.attendance.get = MagicMock()
-        self.attendance.get.side_effect = [
-            Attendance("001", today, Status.Present, None),
-            None,
-            None,
-            None,
-            None,
-            None,
-            None
-        ]
-        self.attendance.create = MagicMock()
+        # Processes an absent workday, a workday with checkins and a weekend day
+        today = datetime.date(2023, 10, 15)
+        self.clock.date_today = Spy(return_value=today)
+
+        self.daily_status.get_latest_status_date = Spy(return_value=datetime.date(2023, 10, 11))
+        self.daily_status.get_flextime_balance = Spy(return_value=2.1)
+        self.daily_status.add = Spy()
 
-        self.vacation.get_approved_request = MagicMock(return_value=None)
+        self.holidays.is_holiday = Spy(return_value=False)
+        self.attendance.get = Spy(return_value=None)
+        self.attendance.create = Spy()
 
-        self.checkin.get = MagicMock()
+        self.vacation.get_approved_request = Spy(return_value=None)
+
+        self.checkin.get = Spy()
         self.checkin.get.side_effect = [
-            CheckinList([]),
-            CheckinList([]),
-            CheckinList([]),
-            CheckinList([]),
+            self.EMPTY_CHECKINS,
             CheckinList([
                 CheckinEvent("E001", datetime.datetime(2023, 10, 13, 8, 0), True, False),
                 CheckinEvent("E002", datetime.datetime(2023, 10, 13, 10, 0), False, False)
             ]),
-            CheckinList([]),
-            CheckinList([])
+            self.EMPTY_CHECKINS
         ]
 
         self.service.process_daily_status()
 
-        self.daily_status.add.assert_called()
-        self.assertEqual(datetime.date(2023, 10, 9), self.daily_status.add.call_args_list[0].args[0].date)
+        self.assertEqual(3, self.daily_status.add.call_count)
+        self.assertEqual(datetime.date(2023, 10, 12), self.daily_status.add.call_args_list[0].args[0].date)
         self.assertEqual(28_800, self.daily_status.add.call_args_list[0].args[0].target_working_time)
         self.assertEqual(-5.9, self.daily_status.add.call_args_list[0].args[0].time_balance)
 
-        self.assertEqual(datetime.date(2023, 10, 10), self.daily_status.add.call_args_list[1].args[0].date)
-        self.assertEqual(28_800, self.daily_status.add.call_args_list[1].args[0].target_working_time)
-        self.assertEqual(-13.9, self.daily_status.add.call_args_list[1].args[0].time_balance)
-
-        self.assertEqual(datetime.date(2023, 10, 11), self.daily_status.add.call_args_list[2].args[0].date)
-        self.assertEqual(28_800, self.daily_status.add.call_args_list[2].args[0].target_working_time)
-        self.assertEqual(-21.9, self.daily_status.add.call_args_list[2].args[0].time_balance)
-
-        self.assertEqual(datetime.date(2023, 10, 12), self.daily_status.add.call_args_list[3].args[0].date)
-        self.assertEqual(28_800, self.daily_status.add.call_args_list[3].args[0].target_working_time)
-        self.assertEqual(-29.9, self.daily_status.add.call_args_list[3].args[0].time_balance)
+        self.assertEqual(datetime.date(2023, 10, 13), self.daily_status.add.call_args_list[1].args[0].date)
+        self.assertEqual(21_600, self.daily_status.add.call_args_list[1].args[0].target_working_time)
+        self.assertEqual(7200, self.daily_status.add.call_args_list[1].args[0].total_working_hours)
+        self.assertEqual(-9.9, self.daily_status.add.call_args_list[1].args[0].time_balance)
 
-        self.assertEqual(datetime.date(2023, 10, 13), self.daily_status.add.call_args_list[4].args[0].date)
-        self.assertEqual(21_600, self.daily_status.add.call_args_list[4].args[0].target_working_time)
-        self.assertEqual(7200, self.daily_status.add.call_args_list[4].args[0].total_working_hours)
-        self.assertEqual(-33.9, self.daily_status.add.call_args_list[4].args[0].time_balance)
+        self.assertEqual(datetime.date(2023, 10, 14), self.daily_status.add.call_args_list[2].args[0].date)
+        self.assertEqual(0, self.daily_status.add.call_args_list[2].args[0].target_working_time)
+        self.assertEqual(-9.9, self.daily_status.add.call_args_list[2].args[0].time_balance)
 
-        self.assertEqual(datetime.date(2023, 10, 14), self.daily_status.add.call_args_list[5].args[0].date)
-        self.assertEqual(0, self.daily_status.add.call_args_list[5].args[0].target_working_time)
-        self.assertEqual(-33.9, self.daily_status.add.call_args_list[5].args[0].time_balance)
-
-        self.assertEqual(datetime.date(2023, 10, 15), self.daily_status.add.call_args_list[6].args[0].date)
-        self.assertEqual(0, self.daily_status.add.call_args_list[6].args[0].target_working_time)
-        self.assertEqual(-33.9, self.daily_status.add.call_args_list[6].args[0].time_balance)
-
-        self.attendance.create.assert_called()
-        self.assertEqual(4, len(self.attendance.create.call_args_list))
-        self.assertEqual(datetime.date(2023, 10, 10), self.attendance.create.call_args_list[0].args[0].date)
+        self.assertEqual(2, self.attendance.create.call_count)
+        self.assertEqual(datetime.date(2023, 10, 12), self.attendance.create.call_args_list[0].args[0].date)
         self.assertEqual(Status.Absent, self.attendance.create.call_args_list[0].args[0].status)
 
-        self.assertEqual(datetime.date(2023, 10, 11), self.attendance.create.call_args_list[1].args[0].date)
-        self.assertEqual(Status.Absent, self.attendance.create.call_args_list[1].args[0].status)
+        self.assertEqual(datetime.date(2023, 10, 13), self.attendance.create.call_args_list[1].args[0].date)
+        self.assertEqual(Status.Present, self.attendance.create.call_args_list[1].args[0].status)
 
-        self.assertEqual(datetime.date(2023, 10, 12), self.attendance.create.call_args_list[2].args[0].date)
-        self.assertEqual(Status.Absent, self.attendance.create.call_args_list[2].args[0].status)
+        self.assertEqual([], self.EMPTY_CHECKINS.events)
 
-        self.assertEqual(datetime.date(2023, 10, 13), self.attendance.create.call_args_list[3].args[0].date)
-        self.assertEqual(Status.Present, self.attendance.create.call_args_list[3].args[0].status)
+    def test_process_leave(self):
+        self.break_times.get_definitions = Spy(return_value=self.EMPTY_BREAKS)
 
-    def test_process_correct_vacation_no_request(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        employee = self._employee()
+        self.employee.get_all = Spy(return_value=[employee])
 
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date(2023, 10, 1))
-        self.employee.get_all = MagicMock(return_value=[employee])
-
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
+        self.definitions.get_by_grade = Spy(return_value=self.flextime_definition)
 
         today = datetime.date(2023, 11, 21)
-        self.clock.date_today = MagicMock(return_value=today)
-
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 11, 19))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=2.1)
-        self.daily_status.add = MagicMock()
-
-        self.checkin.get = MagicMock(return_value=CheckinList([]))
-        self.holidays.is_holiday = MagicMock(return_value=False)
-
-        self.attendance.get = MagicMock(return_value=Attendance("001", today, Status.OnLeave, None))
-        self.attendance.create = MagicMock()
-
-        self.vacation.get_approved_request = MagicMock(return_value=None)
+        self.clock.date_today = Spy(return_value=today)
 
-        self.service.process_daily_status()
-
-        self.daily_status.add.assert_called()
-        self.assertEqual(datetime.date(2023, 11, 20), self.daily_status.add.call_args_list[0].args[0].date)
-        self.assertEqual(0, self.daily_status.add.call_args_list[0].args[0].target_working_time)
-
-        self.vacation.get_approved_request.assert_called_once()
-        self.assertEqual("001", self.vacation.get_approved_request.call_args_list[0].args[0])
-        self.assertEqual(datetime.date(2023, 11, 20), self.vacation.get_approved_request.call_args_list[0].args[1])
-
-    def test_process_correct_vacation_request_full_day(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
+        self.daily_status.get_latest_status_date = Spy(return_value=datetime.date(2023, 11, 19))
+        self.daily_status.get_flextime_balance = Spy(return_value=2.1)
 
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date(2023, 10, 1))
-        self.employee.get_all = MagicMock(return_value=[employee])
-
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
-
-        today = datetime.date(2023, 11, 21)
-        self.clock.date_today = MagicMock(return_value=today)
+        self.checkin.get = Spy(return_value=self.EMPTY_CHECKINS)
+        self.holidays.is_holiday = Spy(return_value=False)
 
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 11, 19))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=2.1)
-        self.daily_status.add = MagicMock()
-
-        self.checkin.get = MagicMock(return_value=CheckinList([]))
-        self.holidays.is_holiday = MagicMock(return_value=False)
-
-        self.attendance.get = MagicMock(return_value=Attendance("001", today, Status.OnLeave, None))
-        self.attendance.create = MagicMock()
-
-        self.vacation.get_approved_request = MagicMock(return_value=Request(False))
-
-        self.service.process_daily_status()
-
-        self.daily_status.add.assert_called()
-        self.assertEqual(datetime.date(2023, 11, 20), self.daily_status.add.call_args_list[0].args[0].date)
-        self.assertEqual(0, self.daily_status.add.call_args_list[0].args[0].target_working_time)
-
-        self.vacation.get_approved_request.assert_called_once()
-        self.assertEqual("001", self.vacation.get_approved_request.call_args_list[0].args[0])
-        self.assertEqual(datetime.date(2023, 11, 20), self.vacation.get_approved_request.call_args_list[0].args[1])
-
-    def test_process_correct_vacation_request_half_day(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
-
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date(2023, 10, 1))
-        self.employee.get_all = MagicMock(return_value=[employee])
-
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
-
-        today = datetime.date(2023, 11, 21)
-        self.clock.date_today = MagicMock(return_value=today)
-
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 11, 19))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=2.1)
-        self.daily_status.add = MagicMock()
-
-        self.checkin.get = MagicMock(return_value=CheckinList([]))
-        self.holidays.is_holiday = MagicMock(return_value=False)
-
-        self.attendance.get = MagicMock(return_value=Attendance("001", today, Status.OnLeave, None))
-        self.attendance.create = MagicMock()
-
-        self.vacation.get_approved_request = MagicMock(return_value=Request(True))
-
-        self.service.process_daily_status()
-
-        self.daily_status.add.assert_called()
-        self.assertEqual(datetime.date(2023, 11, 20), self.daily_status.add.call_args_list[0].args[0].date)
-        self.assertEqual(14400, self.daily_status.add.call_args_list[0].args[0].target_working_time)
-
-        self.vacation.get_approved_request.assert_called_once()
-        self.assertEqual("001", self.vacation.get_approved_request.call_args_list[0].args[0])
-        self.assertEqual(datetime.date(2023, 11, 20), self.vacation.get_approved_request.call_args_list[0].args[1])
-
-    def test_process_other_leave(self):
-        self.break_times.get_definitions = MagicMock(return_value=BreakTimeDefinitions())
-
-        employee = Employee("001", "Test employee", TimeModel.Flextime, "Executive", datetime.date(1990, 5, 21),
-                            datetime.date(2023, 10, 1))
-        self.employee.get_all = MagicMock(return_value=[employee])
-
-        self.definitions.get_by_grade = MagicMock(return_value=self.flextime_definition)
-
-        today = datetime.date(2023, 11, 21)
-        self.clock.date_today = MagicMock(return_value=today)
-
-        self.daily_status.get_latest_status_date = MagicMock(return_value=datetime.date(2023, 11, 19))
-        self.daily_status.get_flextime_balance = MagicMock(return_value=2.1)
-        self.daily_status.add = MagicMock()
+        # Attendance status, approved vacation request, expected target working time, request queried
+        cases = [
+            (Status.OnLeave, None, 0, True),
+            (Status.OnLeave, Request(False), 0, True),
+            (Status.OnLeave, Request(True), 14400, True),
+            (Status.Other, None, 28800, False),
+        ]
 
-        self.checkin.get = MagicMock(return_value=CheckinList([]))
-        self.holidays.is_holiday = MagicMock(return_value=False)
+        for attendance_status, vacation_request, expected_target, request_queried in cases:
+            with self.subTest(attendance_status=attendance_status, vacation_request=vacation_request):
+                self.daily_status.add = Spy()
+                self.attendance.get = Spy(return_value=Attendance("001", today, attendance_status, None))
+                self.attendance.create = Spy()
+                self.vacation.get_approved_request = Spy(return_value=vacation_request)
 
-        self.attendance.get = MagicMock(return_value=Attendance("001", today, Status.Other, None))
-        self.attendance.create = MagicMock()
+                self.service.process_daily_status()
 
-        self.vacation.get_approved_request = MagicMock()
+                self.daily_status.add.assert_called()
+                self.assertEqual(datetime.date(2023, 11, 20), self.daily_status.add.call_args_list[0].args[0].date)
+                self.assertEqual(expected_target,
+                                 self.daily_status.add.call_args_list[0].args[0].target_working_time)
 
-        self.service.process_daily_status()
+                # Leave attendance already exists, so none is created
+                self.attendance.create.assert_not_called()
 
-        self.daily_status.add.assert_called()
-        self.assertEqual(datetime.date(2023, 11, 20), self.daily_status.add.call_args_list[0].args[0].date)
-        self.assertEqual(28800, self.daily_status.add.call_args_list[0].args[0].target_working_time)
+                if not request_queried:
+                    self.vacation.get_approved_request.assert_not_called()
+                    continue
 
-        self.vacation.get_approved_request.assert_not_called()
+                self.vacation.get_approved_request.assert_called_once_with("001", datetime.date(2023, 11, 20))
@@ -0,0 +1,68 @@
+import unittest
+
+from hr_time.tests._spy import Spy
+
+
+class SpyTest(unittest.TestCase):
+    def test_return_value(self):
+        spy = Spy(return_value=42)
+
+        self.assertEqual(42, spy("a", key="b"))
+        self.assertEqual(1, spy.call_count)
+        self.assertEqual(("a",), spy.call_args.args)
+        self.assertEqual({"key": "b"}, spy.call_args.kwargs)
+
+    def test_no_calls(self):
+        spy = Spy()
+
+        self.assertEqual(0, spy.call_count)
+        self.assertIsNone(spy.call_args)
+        self.assertEqual([], spy.call_args_list)
+
+    def test_side_effect_exception(self):
+        self.assertRaises(RuntimeError, Spy(side_effect=RuntimeError))
+        self.assertRaises(RuntimeError, Spy(side_effect=RuntimeError("failed")))
+
+    def test_side_effect_callable(self):
+        spy = Spy(side_effect=lambda value: value * 2)
+
+        self.assertEqual(6, spy(3))
+
+    def test_side_effect_iterable(self):
+        spy = Spy(side_effect=[1, 2])
+
+        self.assertEqual(1, spy())
+        self.assertEqual(2, spy())
+        self.assertRaises(StopIteration, spy)
+
+    def test_side_effect_reassigned(self):
+        spy = Spy(side_effect=[9])
+        self.assertEqual(9, spy())
+
+        spy.side_effect = [7]
+        self.assertEqual(7, spy())
+
+    def test_assert_called(self):
+        spy = Spy()
+        self.assertRaises(AssertionError, spy.assert_called)
+
+        spy()
+        spy.assert_called()
+
+    def test_assert_called_once_with(self):
+        spy = Spy()
+        self.assertRaises(AssertionError, spy.assert_called_once_with)
+
+        spy("a", key="b")
+        spy.assert_called_once_with("a", key="b")
+        self.assertRaises(AssertionError, spy.assert_called_once_with, "a")
+
+        spy("a", key="b")
+        self.assertRaises(AssertionError, spy.assert_called_once_with, "a", key="b")
+
+    def test_assert_not_called(self):
+        spy = Spy()
+        spy.assert_not_called()
+
+        spy()
+        self.assertRaises(AssertionError, spy.assert_not_called)